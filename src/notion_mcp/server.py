@@ -1,106 +1,323 @@
 import os
-import json
+import math
+import time
+import random
+import asyncio
+import hashlib
+import tempfile
+import functools
 import httpx
 from datetime import datetime
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List
+from types import SimpleNamespace
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
 
-import requests
+import orjson
 import feedparser
 from dotenv import load_dotenv
-from fastmcp import FastMCP, Context
+from fastmcp import FastMCP
 
 from .logger import logger
 
-# Find and load .env file from project root
-project_root = Path(__file__).parent.parent
-env_path = project_root / '../.env'
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+ENV_PATH = PROJECT_ROOT / ".env"
+FEEDS_PATH = PROJECT_ROOT / "config" / "feeds.txt"
+FEED_CACHE_PATH = Path.home() / ".cache" / "notion_mcp" / "feeds.json"
 
-if not env_path.exists():
-    raise FileNotFoundError(f"No .env file found at {env_path}")
+NOTION_MAX_CONCURRENCY = 3
+NOTION_RATE_LIMIT = 3  # requests per second
+NOTION_PAGE_SIZE = 100
+NOTION_MAX_RETRIES = 4
+NOTION_RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_BASE_DELAY = 0.3  # seconds
+RETRY_MAX_DELAY = 5.0  # seconds
+RETRY_AFTER_MAX = 30.0  # seconds
+TASKS_CACHE_TTL = 30  # seconds
+TASKS_CACHE_SIZE = 64
+SCHEMA_CACHE_TTL = 600  # seconds
 
-load_dotenv(env_path)
+@functools.lru_cache(maxsize=1)
+def _config() -> SimpleNamespace:
+    """
+    Load and validate Notion settings from the project .env file on first use
+    """
+    if not ENV_PATH.exists():
+        raise FileNotFoundError(f"No .env file found at {ENV_PATH}")
+
+    load_dotenv(ENV_PATH)
+
+    api_key = os.getenv("NOTION_API_KEY")
+    database_id = os.getenv("NOTION_DATABASE_ID")
+
+    if not api_key:
+        raise ValueError("NOTION_API_KEY not found in .env file")
+    if not database_id:
+        raise ValueError("NOTION_DATABASE_ID not found in .env file")
+
+    return SimpleNamespace(
+        api_key=api_key,
+        database_id=database_id,
+        base_url=os.getenv("NOTION_BASE_URL", "https://api.notion.com/v1"),
+        version=os.getenv("NOTION_VERSION", "2022-06-28")
+    )
+
+# Shared client so connections to the Notion API are kept alive between calls.
+# httpx clients cannot be used across event loops, so the client is rebuilt when
+# called from a different loop than the one it was made on; the stale client is
+# only dereferenced, since its loop may already be closed
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared Notion client for the running event loop, creating it on first use
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        config = _config()
+        _client_loop = loop
+        _client = httpx.AsyncClient(
+            base_url=config.base_url,
+            # Built once here; requests inherit these without passing headers=
+            headers={
+                "Authorization": f"Bearer {config.api_key}",
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "Notion-Version": config.version
+            },
+            # Concurrent requests multiplex over one connection
+            http2=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        )
+    return _client
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Seconds to wait before the next attempt, honoring Retry-After (capped at
+    RETRY_AFTER_MAX) when present and valid
+    """
+    if response is not None:
+        try:
+            retry_after = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            retry_after = None
+        if retry_after is not None and math.isfinite(retry_after) and retry_after >= 0:
+            return min(retry_after, RETRY_AFTER_MAX)
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) + random.uniform(0, RETRY_BASE_DELAY)
+
+async def _notion_request(method: str, url: str, idempotent: bool = True, **kwargs) -> httpx.Response:
+    """
+    Send a request to the Notion API, retrying rate limits and transient failures
+    with exponential backoff. Non-idempotent requests are only retried when Notion
+    cannot have acted on them (429 or a failed connection)
+    """
+    for attempt in range(NOTION_MAX_RETRIES + 1):
+        last_attempt = attempt == NOTION_MAX_RETRIES
+        try:
+            response = await get_client().request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            retryable = idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+            if last_attempt or not retryable:
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(f"Notion request {method} {url} failed ({e!r}), retrying in {delay:.1f}s")
+        else:
+            status = response.status_code
+            retryable = status in NOTION_RETRY_STATUSES and (idempotent or status == 429)
+            if last_attempt or not retryable:
+                response.raise_for_status()
+                return response
+            delay = _retry_delay(attempt, response)
+            logger.warning(f"Notion request {method} {url} returned {status}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+# Number of lifespans currently entered. The lifespan runs once per low-level
+# server session (e.g. per SSE connection), so the client is only closed when
+# the last one exits
+_active_lifespans = 0
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Close the shared Notion client when the last server session shuts down
+    """
+    global _client, _client_loop, _active_lifespans
+    _active_lifespans += 1
+    try:
+        yield
+    finally:
+        _active_lifespans -= 1
+        if _active_lifespans == 0:
+            client, client_loop = _client, _client_loop
+            _client, _client_loop = None, None
+            if client is not None and client_loop is asyncio.get_running_loop():
+                await client.aclose()
+
+mcp = FastMCP("Notion Task Manager", lifespan=lifespan, dependencies=["httpx[http2]", "python-dotenv", "orjson"])
+
+def _dump(obj) -> str:
+    """
+    Serialize tool output as indented JSON
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+# Database query results as (timestamp, data), keyed by a hash of the
+# canonical request body. Entries expire after TASKS_CACHE_TTL seconds and
+# the least recently used is evicted beyond TASKS_CACHE_SIZE
+_tasks_cache: "OrderedDict[str, tuple]" = OrderedDict()
+# Bumped on every invalidation, so queries that started before a write don't
+# store their stale results afterwards
+_tasks_cache_generation = 0
 
-NOTION_API_KEY = os.getenv("NOTION_API_KEY")
-DATABASE_ID = os.getenv("NOTION_DATABASE_ID")
-NOTION_BASE_URL = os.getenv("NOTION_BASE_URL", "https://api.notion.com/v1")
-NOTION_VERSION = os.getenv("NOTION_VERSION", "2022-06-28")
+def _invalidate_tasks_cache() -> None:
+    """
+    Drop all cached query results after a write to the database
+    """
+    global _tasks_cache_generation
+    _tasks_cache_generation += 1
+    _tasks_cache.clear()
+
+def _cache_key(body: Dict) -> str:
+    """
+    Hash a query body so equivalent queries share one cache entry
+    """
+    return hashlib.blake2b(orjson.dumps(body, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+def _cache_get(body: Dict) -> Optional[Dict]:
+    """
+    Return the cached result for a query body, or None if missing or expired
+    """
+    key = _cache_key(body)
+    cached = _tasks_cache.get(key)
+    if cached is None:
+        return None
+    ts, data = cached
+    if time.monotonic() - ts >= TASKS_CACHE_TTL:
+        del _tasks_cache[key]
+        return None
+    _tasks_cache.move_to_end(key)
+    return data
 
-if not NOTION_API_KEY:
-    raise ValueError("NOTION_API_KEY not found in .env file")
-if not DATABASE_ID:
-    raise ValueError("NOTION_DATABASE_ID not found in .env file")
+def _cache_put(body: Dict, data: Dict) -> None:
+    """
+    Store a query result, evicting the least recently used entries
+    """
+    key = _cache_key(body)
+    _tasks_cache[key] = (time.monotonic(), data)
+    _tasks_cache.move_to_end(key)
+    while len(_tasks_cache) > TASKS_CACHE_SIZE:
+        _tasks_cache.popitem(last=False)
+
+SORT_BY_CREATED = [
+    {
+        "property": "Created time",
+        "direction": "descending"
+    }
+]
+
+async def query_database(body: Dict) -> Dict:
+    """
+    Query the Notion database across all result pages, serving repeated
+    queries from the cache
+    """
+    cached = _cache_get(body)
+    if cached is not None:
+        return cached
 
-mcp = FastMCP("Notion Task Manager", dependencies=["httpx", "python-dotenv"])
+    generation = _tasks_cache_generation
+    # Notion returns at most NOTION_PAGE_SIZE rows per request; follow the
+    # cursor chain so large databases are not silently truncated
+    results = []
+    page_body = {**body, "page_size": NOTION_PAGE_SIZE}
+    while True:
+        response = await _notion_request("POST", f"/databases/{_config().database_id}/query", json=page_body)
+        page = response.json()
+        results.extend(page.get("results", []))
+        if not page.get("has_more") or not page.get("next_cursor"):
+            break
+        page_body = {**page_body, "start_cursor": page["next_cursor"]}
 
-headers = {
-    "Authorization": f"Bearer {NOTION_API_KEY}",
-    "Content-Type": "application/json",
-    "Notion-Version": NOTION_VERSION
-}
+    data = {**page, "results": results, "has_more": False, "next_cursor": None}
+    if generation == _tasks_cache_generation:
+        _cache_put(body, data)
+    return data
 
 async def fetch_tasks() -> Dict:
     """
     Fetch tasks from Notion database
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{NOTION_BASE_URL}/databases/{DATABASE_ID}/query",
-            headers=headers,
-            json={
-                "sorts": [
-                    {
-                        "property": "Created time",
-                        "direction": "descending"
-                    }
-                ]
-            }
-        )
-        response.raise_for_status()
-        return response.json()
+    return await query_database({"sorts": SORT_BY_CREATED})
+
+async def fetch_tasks_filtered(date_iso: str) -> Dict:
+    """
+    Fetch tasks from Notion database whose deadline falls on the given date
+    """
+    return await query_database({
+        "filter": {
+            "property": "Deadline",
+            "date": {"equals": date_iso}
+        },
+        "sorts": SORT_BY_CREATED
+    })
+
+def _format_task(row: Dict) -> Dict:
+    """
+    Flatten a Notion database row into a task dict
+    """
+    props = row["properties"]
+
+    # Rows almost always have every property, so index directly and fall
+    # back only when one is missing or empty
+
+    # Extract task title
+    try:
+        title = props["Task"]["title"][0]["text"]["content"]
+    except (KeyError, IndexError, TypeError):
+        title = ""
+
+    # Extract completion status
+    try:
+        completed = props["Checkbox"]["checkbox"]
+    except (KeyError, TypeError):
+        completed = False
+
+    # Extract deadline (date is null when unset)
+    try:
+        deadline = props["Deadline"]["date"]["start"]
+    except (KeyError, TypeError):
+        deadline = None
+
+    return {
+        "id": row["id"],
+        "task": title,
+        "completed": completed,
+        "deadline": deadline,
+        "created": row["created_time"]
+    }
 
 @mcp.tool()
 async def show_today_tasks() -> str:
     """Show today's task items from Notion database"""
     try:
-        tasks = await fetch_tasks()
-        formatted_tasks = []
-        today = datetime.now().date().isoformat()
-        
-        for task in tasks.get("results", []):
-            props = task["properties"]
-            
-            # Extract task title
-            task = ""
-            if props.get("Task") and props["Task"].get("title"):
-                task = props["Task"]["title"][0]["text"]["content"] if props["Task"]["title"] else ""
-            
-            # Extract completion status
-            completed = False
-            if props.get("Checkbox"):
-                completed = props["Checkbox"]["checkbox"]
-            
-            # Extract deadline
-            deadline = None
-            if props.get("Deadline") and props["Deadline"].get("date"):
-                deadline = props["Deadline"]["date"]["start"]
-            
-            formatted_task = {
-                "id": task["id"],
-                "task": task,
-                "completed": completed,
-                "deadline": deadline,
-                "created": task["created_time"]
-            }
-            
-            # Only include today's items
-            if deadline and deadline.startswith(today):
-                formatted_tasks.append(formatted_task)
+        today = datetime.now().strftime("%Y-%m-%d")
+        tasks = await fetch_tasks_filtered(today)
+        formatted_tasks = [_format_task(row) for row in tasks.get("results", [])]
+        # Notion already filtered on Deadline; this guards against timezone
+        # edge cases with a fixed-length compare of the date part
+        formatted_tasks = [
+            task for task in formatted_tasks
+            if task["deadline"] and task["deadline"][:10] == today
+        ]
         
         if not formatted_tasks:
             return "No tasks scheduled for today."
         
-        return json.dumps(formatted_tasks, indent=2)
+        return _dump(formatted_tasks)
         
     except Exception as e:
         logger.error(f"Notion API error: {str(e)}")
@@ -111,106 +328,209 @@ async def list_all_tasks() -> str:
     """List all task items from Notion database"""
     try:
         tasks = await fetch_tasks()
-        formatted_tasks = []
-        
-        for task in tasks.get("results", []):
-            props = task["properties"]
-            
-            # Extract task title
-            task = ""
-            if props.get("Task") and props["Task"].get("title"):
-                task = props["Task"]["title"][0]["text"]["content"] if props["Task"]["title"] else ""
-            
-            # Extract completion status
-            completed = False
-            if props.get("Checkbox"):
-                completed = props["Checkbox"]["checkbox"]
-            
-            # Extract deadline
-            deadline = None
-            if props.get("Deadline") and props["Deadline"].get("date"):
-                deadline = props["Deadline"]["date"]["start"]
-            
-            formatted_task = {
-                "id": task["id"],
-                "task": task,
-                "completed": completed,
-                "deadline": deadline,
-                "created": task["created_time"]
-            }
-            
-            formatted_tasks.append(formatted_task)
+        formatted_tasks = [_format_task(row) for row in tasks.get("results", [])]
         
         if not formatted_tasks:
             return "No tasks found in the database."
         
-        return json.dumps(formatted_tasks, indent=2)
+        return _dump(formatted_tasks)
         
     except Exception as e:
         logger.error(f"Notion API error: {str(e)}")
         return f"Error fetching tasks: {str(e)}\nPlease make sure your Notion integration is properly set up and has access to the database."
 
+# Formatted schema JSON, reused for SCHEMA_CACHE_TTL seconds
+_schema_cache = {"json": None, "ts": 0.0}
+
 @mcp.resource("notion://database/schema")
 async def get_database_schema() -> str:
     """Get the schema of the Notion database"""
+    now = time.monotonic()
+    if _schema_cache["json"] is not None and now - _schema_cache["ts"] < SCHEMA_CACHE_TTL:
+        return _schema_cache["json"]
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{NOTION_BASE_URL}/databases/{DATABASE_ID}",
-                headers=headers
-            )
-            response.raise_for_status()
-            database = response.json()
-            
-            # Extract and format the schema
-            properties = database.get("properties", {})
-            schema = {name: prop["type"] for name, prop in properties.items()}
-            
-            return json.dumps(schema, indent=2)
+        response = await _notion_request("GET", f"/databases/{_config().database_id}")
+        database = response.json()
+        
+        # Extract and format the schema
+        properties = database.get("properties", {})
+        schema = {name: prop["type"] for name, prop in properties.items()}
+        
+        _schema_cache["json"] = _dump(schema)
+        _schema_cache["ts"] = now
+        return _schema_cache["json"]
     except Exception as e:
         logger.error(f"Failed to fetch database schema: {str(e)}")
         return f"Error fetching database schema: {str(e)}"
     
+def _parse_feed(content: bytes, url: str) -> List[Dict]:
+    """
+    Parse feed bytes and return only the latest entries
+    """
+    feed = feedparser.parse(content)
+    return [
+        {
+            "title": entry.title,
+            "link": entry.link,
+            "published": getattr(entry, "published", None),
+            "source": feed.feed.get("title", url)
+        }
+        for entry in feed.entries[:5]  # Limit to 5 per feed
+    ]
+
+# Conditional GET validators and latest entries per normalized feed URL,
+# persisted to FEED_CACHE_PATH so unchanged feeds survive restarts
+_feed_cache: Optional[Dict[str, Dict]] = None
+_feed_cache_dirty = False
+
+def _normalize_feed_url(url: str) -> str:
+    """
+    Canonical form of a feed URL used as its cache key
+    """
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+def _load_feed_cache() -> Dict[str, Dict]:
+    """
+    Return the feed cache, reading it from disk on first use
+    """
+    global _feed_cache
+    if _feed_cache is None:
+        try:
+            _feed_cache = orjson.loads(FEED_CACHE_PATH.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            _feed_cache = {}
+    return _feed_cache
+
+def _prune_feed_cache(feeds: List[str]) -> None:
+    """
+    Drop cached entries for feeds no longer listed in feeds.txt
+    """
+    global _feed_cache_dirty
+    cache = _load_feed_cache()
+    keep = {_normalize_feed_url(url) for url in feeds}
+    for key in [key for key in cache if key not in keep]:
+        del cache[key]
+        _feed_cache_dirty = True
+
+def _write_feed_cache(data: bytes) -> None:
+    """
+    Atomically replace the feed cache file, so overlapping writes never
+    leave a partial file behind
+    """
+    try:
+        FEED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=FEED_CACHE_PATH.parent, prefix=".feeds-", suffix=".json")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, FEED_CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Failed to save feed cache to {FEED_CACHE_PATH}: {str(e)}")
+
+async def _save_feed_cache() -> None:
+    """
+    Write the feed cache to disk if any entry changed since the last save
+    """
+    global _feed_cache_dirty
+    if not _feed_cache_dirty:
+        return
+    _feed_cache_dirty = False
+    await asyncio.to_thread(_write_feed_cache, orjson.dumps(_load_feed_cache()))
+
+async def _fetch_feed(feed_client: httpx.AsyncClient, url: str) -> List[Dict]:
+    """
+    Fetch a single feed and return its latest entries, reusing cached
+    entries when the server reports the feed unchanged
+    """
+    global _feed_cache_dirty
+    key = _normalize_feed_url(url)
+    cached = _load_feed_cache().get(key)
+
+    request_headers = {}
+    if cached:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    resp = await feed_client.get(url, headers=request_headers, timeout=10, follow_redirects=True)
+    if resp.status_code == 304 and cached:
+        return cached["entries"]
+    resp.raise_for_status()
+    # feedparser is synchronous, so run in thread. Entries are extracted in
+    # the worker too, so the parsed feed is dropped before returning
+    entries = await asyncio.to_thread(_parse_feed, resp.content, url)
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _load_feed_cache()[key] = {"etag": etag, "last_modified": last_modified, "entries": entries}
+        _feed_cache_dirty = True
+    return entries
+
+# Parsed feeds.txt, re-read only when the file's mtime changes
+_feeds_cache = {"mtime": None, "feeds": []}
+
+def _get_feeds() -> List[str]:
+    """
+    Return the feed URLs listed in feeds.txt
+    """
+    try:
+        mtime = os.stat(FEEDS_PATH).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"feeds.txt not found at {FEEDS_PATH}") from None
+
+    if mtime != _feeds_cache["mtime"]:
+        with open(FEEDS_PATH, "r") as f:
+            feeds = [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+        # Drop feeds listed more than once under different spellings
+        unique_feeds = {}
+        for url in feeds:
+            unique_feeds.setdefault(_normalize_feed_url(url), url)
+
+        _feeds_cache["feeds"] = list(unique_feeds.values())
+        _feeds_cache["mtime"] = mtime
+    return _feeds_cache["feeds"]
+
 @mcp.tool()
 async def fetch_latest_articles() -> str:
     """
     Fetch latest articles from multiple sites and list them out.
     """
-    feeds_path = f'{Path(__file__).parent.parent.parent}/config/feeds.txt' 
-    if not Path(feeds_path).exists():
-        raise FileNotFoundError(f"feeds.txt not found at {feeds_path}")
-
-    with open(feeds_path, "r") as f:
-        feeds = [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
-
+    feeds = _get_feeds()
+    _prune_feed_cache(feeds)
     if not feeds:
         return "No feeds found."
 
-    articles = []
-    for url in feeds:
-        try:
-            # feedparser is synchronous, so run in thread
-            import asyncio
-            loop = asyncio.get_event_loop()
-            resp = requests.get(url)
-            feed = feedparser.parse(resp.content)
-            for entry in feed.entries[:5]:  # Limit to 5 per feed
-                articles.append({
-                    "title": entry.title,
-                    "link": entry.link,
-                    "published": getattr(entry, "published", None),
-                    "source": feed.feed.get("title", url)
-                })
-        except Exception as e:
-            articles.append({"error": f"Failed to fetch {url}: {str(e)}"})
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    ) as feed_client:
+
+        # Failures are caught per feed so one bad feed never cancels the rest
+        async def _fetch_one(url: str) -> List[Dict]:
+            try:
+                return await _fetch_feed(feed_client, url)
+            except Exception as e:
+                return [{"error": f"Failed to fetch {url}: {str(e)}"}]
+
+        results = await asyncio.gather(*[_fetch_one(url) for url in feeds])
+    await _save_feed_cache()
+
+    articles = [article for result in results for article in result]
     if not articles:
         return "No articles found."
-    return json.dumps(articles, indent=2)
+    return _dump(articles)
 
 @mcp.tool()
 async def add_task_to_notion(title: str, url: str):
     payload = {
-        "parent": {"database_id": DATABASE_ID},
+        "parent": {"database_id": _config().database_id},
         "properties": {
             "Task": {
                 "title": [{"text": {"content": title}}]
@@ -220,26 +540,33 @@ async def add_task_to_notion(title: str, url: str):
             }
         }
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{NOTION_BASE_URL}/pages",
-            headers=headers,
-            json=payload
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await _notion_request("POST", "/pages", idempotent=False, json=payload)
+    # Invalidate cached task lists so the new task shows up immediately
+    _invalidate_tasks_cache()
+    return response.json()
 
 @mcp.tool()
 async def add_articles_as_reading_tasks(articles: List[Dict]) -> str:
     """
     Add recommended articles as reading tasks in Notion.
     """
-   
-    results = []
-    for article in articles:
-        try:
-            res = await add_task_to_notion(article["title"], article["url"])
-            results.append({"title": article["title"], "status": "added"})
-        except Exception as e:
-            results.append({"title": article["title"], "status": f"error: {str(e)}"})
-    return json.dumps(results, indent=2)
\ No newline at end of file
+    # Notion allows an average of NOTION_RATE_LIMIT requests per second per
+    # integration. Each slot is held for at least NOTION_MAX_CONCURRENCY /
+    # NOTION_RATE_LIMIT seconds, which bounds the request rate as well as the
+    # number of requests in flight
+    sem = asyncio.Semaphore(NOTION_MAX_CONCURRENCY)
+    min_slot_time = NOTION_MAX_CONCURRENCY / NOTION_RATE_LIMIT
+
+    async def _add_one(article: Dict) -> Dict:
+        async with sem:
+            started = time.monotonic()
+            try:
+                await add_task_to_notion(article["title"], article["url"])
+                return {"title": article["title"], "status": "added"}
+            except Exception as e:
+                return {"title": article["title"], "status": f"error: {str(e)}"}
+            finally:
+                await asyncio.sleep(max(0.0, min_slot_time - (time.monotonic() - started)))
+
+    results = await asyncio.gather(*[_add_one(article) for article in articles])
+    return _dump(results)